@@ -10,61 +10,101 @@ This single-file prototype bundles basic models, storage, an interactive executo
 and simple evidence capture (screenshots). Everything is local and offline.
 
 Dependencies (install locally):
-  pip install pyautogui pillow
+  Python 3.10+ (the models use dataclass slots)
+  pip install mss pyautogui pillow
+  pip install orjson   # optional, faster JSON load/save
 
-Note: pyautogui may require additional OS-specific packages. If unavailable, the
+Note: screenshots are captured with mss when available, falling back to pyautogui
+(which may require additional OS-specific packages). If neither is usable, the
 screenshot function will gracefully fall back to creating a small placeholder.
 
 """
 
 import argparse
+import concurrent.futures
 import json
 import os
 import uuid
-from dataclasses import dataclass, asdict, field
+from collections import deque, namedtuple
+from dataclasses import dataclass, field
 from datetime import datetime
 from itertools import filterfalse
-from typing import List, Dict, Optional
+from pathlib import Path
+from typing import Deque, List, Dict, Iterator, Optional, Tuple
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except Exception:
+    ORJSON_AVAILABLE = False
 
 # -----------------------------
 # Configuration / Paths
 # -----------------------------
-BASE_DIR = os.path.abspath(os.path.dirname(__file__))
-DATA_DIR = os.path.join(BASE_DIR, "data")
-EVIDENCE_DIR = os.path.join(BASE_DIR, "evidence")
-CASES_FILE = os.path.join(DATA_DIR, "test_cases.json")
-PLANS_FILE = os.path.join(DATA_DIR, "test_plans.json")
-EXECUTIONS_FILE = os.path.join(DATA_DIR, "executions.json")
+BASE_DIR = Path(__file__).resolve().parent
+DATA_DIR = BASE_DIR / "data"
+EVIDENCE_DIR = BASE_DIR / "evidence"
+CASES_FILE = DATA_DIR / "test_cases.json"
+PLANS_FILE = DATA_DIR / "test_plans.json"
+EXECUTIONS_FILE = DATA_DIR / "executions.jsonl"
+# Executions were stored as a single JSON array before the switch to JSON Lines
+LEGACY_EXECUTIONS_FILE = DATA_DIR / "executions.json"
+
+# Data files are machine-read; --pretty switches back to indented output
+PRETTY_JSON = False
+
+# Parsed file contents keyed by path; see _CacheEntry
+_JSON_CACHE: Dict[Path, "_CacheEntry"] = {}
 
 # -----------------------------
 # Utilities
 # -----------------------------
 
+_DIRS_READY = False
+
 def ensure_dirs():
+    global _DIRS_READY
+    if _DIRS_READY:
+        return
     os.makedirs(DATA_DIR, exist_ok=True)
     os.makedirs(EVIDENCE_DIR, exist_ok=True)
+    _DIRS_READY = True
 
 def now_iso():
     return datetime.now().isoformat()
 
+# Random bytes for new ids are read in batches to avoid one os.urandom call per id
+_UUID_POOL: Deque[uuid.UUID] = deque()
+_UUID_BATCH = 64
+
+def _fast_uuid4() -> uuid.UUID:
+    if not _UUID_POOL:
+        buf = os.urandom(16 * _UUID_BATCH)
+        _UUID_POOL.extend(uuid.UUID(bytes=buf[i:i + 16], version=4) for i in range(0, len(buf), 16))
+    return _UUID_POOL.popleft()
+
 # -----------------------------
 # Models
 # -----------------------------
-@dataclass
+@dataclass(slots=True)
 class TestStep:
     description: str
     expected_result: str
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=lambda: str(_fast_uuid4()))
 
     def to_dict(self):
-        return asdict(self)
+        return {
+            "description": self.description,
+            "expected_result": self.expected_result,
+            "id": self.id,
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class TestCase:
     title: str
     steps: List[TestStep]
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=lambda: str(_fast_uuid4()))
     reusable: bool = False
 
     def to_dict(self):
@@ -75,96 +115,283 @@ class TestCase:
             "steps": [s.to_dict() for s in self.steps],
         }
 
-@dataclass
+@dataclass(slots=True)
 class TestPlan:
     name: str
     test_case_ids: List[str]
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=lambda: str(_fast_uuid4()))
 
     def to_dict(self):
-        return asdict(self)
+        return {
+            "name": self.name,
+            "test_case_ids": list(self.test_case_ids),
+            "id": self.id,
+        }
 
 
 # -----------------------------
 # Storage
 # -----------------------------
 
+# raw holds the file bytes; titles_lower maps normalised titles to list positions
+_CacheEntry = namedtuple("_CacheEntry", "mtime_ns size raw titles_lower")
+
+
+def _index_by_title(items) -> Dict[str, int]:
+    # Map normalised title -> list position so lookups don't rescan the list;
+    # the first case wins when titles only differ by case or whitespace
+    idx = {}
+    for i, c in enumerate(items):
+        if "title" in c:
+            idx.setdefault(c["title"].strip().lower(), i)
+    return idx
+
+
+def _make_cache_entry(st, raw: bytes, data: List[Dict]) -> _CacheEntry:
+    return _CacheEntry(st.st_mtime_ns, st.st_size, raw, _index_by_title(data))
+
+
+def _refresh_cache(path) -> Tuple[Optional[_CacheEntry], Optional[List[Dict]]]:
+    """Return the cache entry for path, re-reading the file only if it changed.
+
+    On a re-read the freshly parsed list is returned alongside the entry so
+    the caller doesn't have to parse the bytes again; on a hit it is None.
+    """
+    path = Path(path)
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        _JSON_CACHE.pop(path, None)
+        return None, None
+
+    cached = _JSON_CACHE.get(path)
+    if cached is not None and (cached.mtime_ns, cached.size) == (st.st_mtime_ns, st.st_size):
+        return cached, None
+
+    with open(path, "rb") as f:
+        raw = f.read()
+    data = _parse_list(raw)
+    entry = _make_cache_entry(st, raw, data)
+    _JSON_CACHE[path] = entry
+    return entry, data
+
+
+def _cache_for(kind) -> _CacheEntry:
+    path = {"case": CASES_FILE, "plan": PLANS_FILE}[kind]
+    entry, _ = _refresh_cache(path)
+    return entry or _CacheEntry(0, 0, b"", {})
+
+
+def _dumps(obj, pretty: bool = False) -> bytes:
+    """Serialise obj to UTF-8 JSON bytes, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(data: bytes):
+    # Both parsers raise ValueError subclasses on bad input (JSON or UTF-8)
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def get_items(kind):
     path = {"case": CASES_FILE, "plan": PLANS_FILE, "exec": EXECUTIONS_FILE}[kind]
+    if kind == "exec":
+        # Executions are JSON Lines; yield records lazily
+        _migrate_legacy_executions()
+        return iter_jsonl(path)
     return load_json(path)
 
 def save_items(kind, data):
     path = {"case": CASES_FILE, "plan": PLANS_FILE, "exec": EXECUTIONS_FILE}[kind]
     if kind == "exec":
-        # Load existing executions
-        existing = load_json(path) or []
-        # Append the new execution record (single dict)
-        existing.append(data)
-        save_json(path, existing)
+        # Append the new execution record (single dict) as one line
+        _migrate_legacy_executions()
+        append_jsonl(path, data)
     else:
         # For cases and plans, we save the whole list (overwrite)
         save_json(path, data)
 
 def load_json(path) -> Optional[List[Dict]]:
-    if not os.path.exists(path):
+    entry, data = _refresh_cache(path)
+    if entry is None:
+        return []
+    if data is not None:
+        return data
+    # Re-parse the cached bytes so callers get their own objects to mutate
+    return _parse_list(entry.raw)
+
+
+def _parse_list(raw: bytes) -> List[Dict]:
+    try:
+        data = _loads(raw)
+    except ValueError:
+        return []
+    if isinstance(data, dict):
+        return [data]
+    elif isinstance(data, list):
+        return data
+    else:
         return []
-    with open(path, "r", encoding="utf-8") as f:
-        try:
-            data = json.load(f)
-            if isinstance(data, dict):
-                return [data]
-            elif isinstance(data, list):
-                return data
-            else:
-                return []
-        except json.JSONDecodeError:
-            return []
 
 
 def save_json(path, data):
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    # Write to a sibling temp file and swap it in, so an interrupted save
+    # never leaves a truncated file behind
+    path = Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    raw = _dumps(data, pretty=PRETTY_JSON)
+    try:
+        with open(tmp, "wb") as f:
+            f.write(raw)
+        os.replace(tmp, path)
+    except BaseException:
+        # Don't leave the partial temp file behind in data/
+        tmp.unlink(missing_ok=True)
+        raise
+    st = os.stat(path)
+    _JSON_CACHE[path] = _make_cache_entry(st, raw, data)
+
+
+def iter_jsonl(path) -> Iterator[Dict]:
+    if not os.path.exists(path):
+        return
+    with open(path, "rb") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                yield _loads(line)
+            except ValueError:
+                # e.g. a trailing record cut short by an interrupted append
+                continue
+
+
+def append_jsonl(path, record):
+    line = _dumps(record) + b"\n"
+    with open(path, "a+b") as f:
+        # Start on a fresh line if a previous append was cut short
+        if f.seek(0, os.SEEK_END) > 0:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                line = b"\n" + line
+        f.write(line)
+
+
+def _migrate_legacy_executions():
+    """Move records from the old executions.json array into executions.jsonl."""
+    if not LEGACY_EXECUTIONS_FILE.exists():
+        return
+    records = load_json(LEGACY_EXECUTIONS_FILE)
+    raw = b"".join(_dumps(r) + b"\n" for r in records)
+    # Older records go first, ahead of anything already in the new file
+    if EXECUTIONS_FILE.exists():
+        existing = EXECUTIONS_FILE.read_bytes()
+        if existing and not existing.endswith(b"\n"):
+            existing += b"\n"
+        raw += existing
+    tmp = EXECUTIONS_FILE.with_name(EXECUTIONS_FILE.name + ".tmp")
+    tmp.write_bytes(raw)
+    os.replace(tmp, EXECUTIONS_FILE)
+    # Keep the original file as a backup rather than deleting it
+    os.replace(LEGACY_EXECUTIONS_FILE, LEGACY_EXECUTIONS_FILE.with_name(LEGACY_EXECUTIONS_FILE.name + ".migrated"))
+    _JSON_CACHE.pop(LEGACY_EXECUTIONS_FILE, None)
 
 # -----------------------------
 # Evidence capture
 # -----------------------------
+try:
+    import mss
+    import mss.tools
+    MSS_AVAILABLE = True
+except Exception:
+    MSS_AVAILABLE = False
+
 try:
     import pyautogui
-    from PIL import Image
     PYAUTOGUI_AVAILABLE = True
 except Exception:
     PYAUTOGUI_AVAILABLE = False
 
+# Placeholder used when no capture backend works; drawn once at import
+try:
+    from PIL import Image, ImageDraw
+    _PLACEHOLDER_IMG = Image.new("RGBA", (400, 200), (220, 220, 220, 255))
+    ImageDraw.Draw(_PLACEHOLDER_IMG).text((10, 10), "placeholder screenshot", fill=(0, 0, 0))
+except Exception:
+    _PLACEHOLDER_IMG = None
+
+
+# The screen is grabbed on the calling thread so the evidence matches the moment
+# the tester asked for it; only PNG encoding and the file write run in the
+# background. Pending writes are tracked so an execution is only recorded once
+# its evidence exists on disk.
+_SCREENSHOT_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+_PENDING_SCREENSHOTS: List[tuple] = []  # (path, Future)
+
 
 def take_screenshot(test_id: str, step_id: str) -> str:
-    """Take a screenshot and return path. Falls back to placeholder if pyautogui missing."""
-    run_folder = os.path.join(EVIDENCE_DIR, test_id)
-    os.makedirs(run_folder, exist_ok=True)
-    filename = f"{step_id}_{uuid.uuid4().hex}.png"
-    path = os.path.join(run_folder, filename)
+    """Capture the screen, queue the PNG write and return its path.
+
+    Falls back to placeholder if no capture backend works.
+    """
+    run_folder = EVIDENCE_DIR / test_id
+    run_folder.mkdir(parents=True, exist_ok=True)
+    path = run_folder / f"{step_id}_{_fast_uuid4().hex}.png"
+
+    write = _grab_screen(path)
+    if write is None:
+        # last resort: create an empty file
+        print("Placeholder image unavailable; creating an empty file.")
+        path.write_bytes(b"")
+        return str(path)
+
+    _PENDING_SCREENSHOTS.append((path, _SCREENSHOT_EXECUTOR.submit(write)))
+    return str(path)
+
+
+def wait_for_screenshots():
+    """Block until every queued screenshot has been written and report failures."""
+    concurrent.futures.wait([f for _, f in _PENDING_SCREENSHOTS])
+    for path, future in _PENDING_SCREENSHOTS:
+        error = future.exception()
+        if error is not None:
+            print(f"Screenshot could not be saved to {path}: {error}")
+    _PENDING_SCREENSHOTS.clear()
+
+
+def _grab_screen(path: Path):
+    """Grab the screen now and return a callable that writes it to path as PNG."""
+    if MSS_AVAILABLE:
+        try:
+            # monitors[0] is the bounding box of all attached displays
+            with mss.mss() as sct:
+                sct_img = sct.grab(sct.monitors[0])
+            return lambda: mss.tools.to_png(sct_img.rgb, sct_img.size, level=1, output=str(path))
+        except Exception as e:
+            print(f"mss screenshot failed: {e}. Trying pyautogui.")
 
     if PYAUTOGUI_AVAILABLE:
         try:
             img = pyautogui.screenshot()
-            img.save(path)
-            return path
+            return lambda: img.save(path, format="PNG", compress_level=1, optimize=False)
         except Exception as e:
             # graceful fallback
             print(f"Screenshot failed: {e}. Creating placeholder image.")
 
-    # Fallback: create a tiny placeholder PNG
-    try:
-        from PIL import Image, ImageDraw
-        img = Image.new("RGBA", (400, 200), (220, 220, 220, 255))
-        d = ImageDraw.Draw(img)
-        d.text((10, 10), "placeholder screenshot", fill=(0, 0, 0))
-        img.save(path)
-        return path
-    except Exception:
-        # last resort: create an empty file
-        with open(path, "wb") as f:
-            f.write(b"")
-        return path
+    # Fallback: save a copy of the tiny placeholder PNG
+    if _PLACEHOLDER_IMG is not None:
+        # copy so concurrent workers never save the shared image at once
+        img = _PLACEHOLDER_IMG.copy()
+        return lambda: img.save(path, format="PNG", compress_level=1, optimize=False)
+    return None
 
 
 # -----------------------------
@@ -176,14 +403,15 @@ def run_test_case_interactive(case_dict: Dict) -> Dict:
 
     Returns an execution record that can be saved.
     """
-    tc_id = case_dict.get("id") or str(uuid.uuid4())
+    tc_id = case_dict.get("id") or str(_fast_uuid4())
     title = case_dict.get("title", "<no-title>")
 
     print(f"\n=== Running test case: {title} ===")
     results = []
+    started_at = now_iso()
 
     for idx, step in enumerate(case_dict.get("steps", []), start=1):
-        sid = step.get("id") or str(uuid.uuid4())
+        sid = step.get("id") or str(_fast_uuid4())
         print(f"\nStep {idx}: {step.get('description')}")
         print(f"Expected: {step.get('expected_result')}")
 
@@ -195,13 +423,15 @@ def run_test_case_interactive(case_dict: Dict) -> Dict:
 
         if user == "s":
             screenshot_path = take_screenshot(tc_id, sid)
-            print(f"Saved screenshot: {screenshot_path}")
+            print(f"Saving screenshot: {screenshot_path}")
             # ask for final outcome after screenshot
             user = input("Result after screenshot (p/f): ").strip().lower()
 
+        timestamp = now_iso()
+
         if user == "q":
             print("Aborting test run early.")
-            results.append({"step": sid, "outcome": "aborted", "timestamp": now_iso()})
+            results.append({"step": sid, "outcome": "aborted", "timestamp": timestamp})
             break
 
         if user not in ("p", "f"):
@@ -213,14 +443,17 @@ def run_test_case_interactive(case_dict: Dict) -> Dict:
             "outcome": "pass" if user == "p" else "fail",
             "screenshot": screenshot_path,
             "recording": recording_path,
-            "timestamp": now_iso(),
+            "timestamp": timestamp,
         })
 
+    # Make sure all evidence is on disk before recording the execution
+    wait_for_screenshots()
+
     exec_record = {
-        "execution_id": str(uuid.uuid4()),
+        "execution_id": str(_fast_uuid4()),
         "test_case_id": tc_id,
         "title": title,
-        "started_at": now_iso(),
+        "started_at": started_at,
         "results": results,
     }
 
@@ -231,25 +464,35 @@ def run_test_case_interactive(case_dict: Dict) -> Dict:
 # -----------------------------
 # Editing a Test Case
 # -----------------------------
+def _load_case_for_update(title: str):
+    """Return a fresh cases list and the entry in it titled `title`."""
+    entry, cases = _refresh_cache(CASES_FILE)
+    pos = entry.titles_lower.get(title.strip().lower()) if entry else None
+    if pos is None:
+        print(f"Test case '{title}' no longer exists.")
+        return None, None
+    if cases is None:
+        cases = _parse_list(entry.raw)
+    return cases, cases[pos]
+
 def edit_test_case_interactive(case_dict: Dict):
     title = case_dict.get("title")
     print(f"Editing test case: {title}.")
     user_action = input("Action: (R=Rename, E=Edit Test Steps, X=Exit)").strip().lower()
 
     if user_action == "r":
-        cases = get_items("case") or []
+        cases, stored_case = _load_case_for_update(title)
+        if stored_case is None:
+            return
         while True:
             renamed_title = input("New test case title: ").strip()
             if not renamed_title:
                 print("Title cannot be empty.")
                 return
 
-            if is_new_test_case_title_unique(renamed_title, cases):
+            if is_new_test_case_title_unique(renamed_title):
                 # After editing, save updated title to file
-                for c in cases:
-                    if c.get("title") == title:
-                        c["title"] = renamed_title
-                        break
+                stored_case["title"] = renamed_title
                 save_items("case", cases)
                 break
             # Otherwise, prompt again
@@ -359,11 +602,10 @@ def edit_test_case_interactive(case_dict: Dict):
                 break
 
         # After editing/reordering, save updated steps to file
-        cases = get_items("case") or []
-        for c in cases:
-            if c.get("title") == title:
-                c["steps"] = steps
-                break
+        cases, stored_case = _load_case_for_update(title)
+        if stored_case is None:
+            return
+        stored_case["steps"] = steps
         save_items("case", cases)
         print(f"Test case '{title}' updated successfully.")
 
@@ -408,26 +650,23 @@ def edit_by_title(titlep: str):
         edit_test_case_interactive(matching_case)
 
 def check_for_matching_test_case_by_title(titlep: str):
-    cases = get_items("case") or []
     title_lwr = titlep.strip().lower()
-    match = None
-    for c in cases:
-        if c.get("title").lower() == title_lwr:
-            match = c
-            return match
-    if not match:
+    entry = _cache_for("case")
+    pos = entry.titles_lower.get(title_lwr)
+    if pos is None:
         print(f"No test case with title '{title_lwr}' found.")
-        return match
+        return None
+    return _parse_list(entry.raw)[pos]
 
 def show_executions():
-    records = get_items("exec") or []
-    if not records:
-        print("No executions recorded yet.")
-        return
-    for r in records:
+    found = False
+    for r in get_items("exec"):
+        found = True
         print(f"Execution {r.get('execution_id')} - {r.get('title')} - started {r.get('started_at')}")
         for idx, res in enumerate(r.get('results', []), start=1):
             print(f"  Step {idx}: {res.get('outcome')}  screenshot: {res.get('screenshot')}")
+    if not found:
+        print("No executions recorded yet.")
 
 def add_case_interactive():
     cases = get_items("case") or []
@@ -438,13 +677,15 @@ def add_case_interactive():
             print("Title cannot be empty.")
             return
 
-        if is_new_test_case_title_unique(title, cases):
+        if is_new_test_case_title_unique(title):
             break
         # Otherwise, prompt again
         print("Please enter a unique title.\n")
 
     steps = []
     steps = add_test_step_interactive(steps)
+    if not steps:
+        return
 
     tc = TestCase(title=title, steps=[TestStep(**s) for s in steps])
     cases.append(tc.to_dict())
@@ -458,12 +699,11 @@ def add_test_step_interactive(steps):
         if not desc:
             break
         expected = input(" Expected result: ").strip()
-        steps.append(TestStep(description=desc, expected_result=expected).to_dict())
-        return steps
+        steps.append({"description": desc, "expected_result": expected, "id": str(_fast_uuid4())})
 
     if not steps:
         print("No steps added; aborting.")
-        return steps
+    return steps
 
 def copy_test_step_interactive(steps):
     if not steps:
@@ -567,10 +807,9 @@ def delete_test_step_interactive(steps):
     # Return updated steps
     return steps
 
-def is_new_test_case_title_unique(new_title, cases):
+def is_new_test_case_title_unique(new_title):
     # Enforce unique title
-    existing_titles = [c.get("title", "").strip().lower() for c in cases]
-    if new_title.strip().lower() in existing_titles:
+    if new_title.strip().lower() in _cache_for("case").titles_lower:
         print(f"A test case with the title '{new_title}' already exists. Please choose a unique name.")
         return False
     else:
@@ -584,9 +823,13 @@ def parse_args_and_run():
     parser.add_argument("--executions", action="store_true", help="Show past executions")
     parser.add_argument("--add", action="store_true", help="Interactively add a new test case")
     parser.add_argument("--edit", metavar='TITLE', help="Edit a test case by title")
+    parser.add_argument("--pretty", action="store_true", help="Write data files as indented, human-readable JSON")
 
     args = parser.parse_args()
 
+    global PRETTY_JSON
+    PRETTY_JSON = args.pretty
+
     ensure_dirs()
 
     if args.init_sample: